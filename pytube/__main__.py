@@ -107,7 +107,7 @@ class YouTube:
 
     @property
     def age_restricted(self):
-        if self._age_restricted:
+        if self._age_restricted is not None:
             return self._age_restricted
         self._age_restricted = extract.is_age_restricted(self.watch_html)
         return self._age_restricted
@@ -6,7 +6,7 @@ import re
 from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import parse_qs, quote, urlencode, urlparse
+from urllib.parse import parse_qsl, quote, urlencode, urlparse
 
 
 
@@ -17,6 +17,20 @@ from urllib.parse import parse_qs, quote, urlencode, urlparse
 
 logger = logging.getLogger(__name__)
 
+_PUBLISH_DATE_RE = re.compile(
+    r"itemprop=\"datePublished\" content=\"(\d{4}-\d{2}-\d{2})\""
+)
+_VIDEO_ID_RE = re.compile(r"(?:v=|/|embed/)([0-9A-Za-z_-]{11})")
+_PRIVATE_STRINGS = (
+    "This is a private video. Please sign in to verify that you may see it.",
+    "\"simpleText\":\"Private video\"",
+    "This video is private."
+)
+_RECORDING_UNAVAILABLE = 'This live stream recording is not available.'
+# Matches both ``window["ytInitialData"] = `` and ``ytInitialData = ``. The
+# pattern starts on the shared literal so SRE can use its prefix search.
+_INITIAL_DATA_RE = re.compile(r"ytInitialData(?:['\"]\])?\s*=\s*")
+
 
 def publish_date(watch_html: str):
     """Extract publish date
@@ -27,10 +41,7 @@ def publish_date(watch_html: str):
         Publish date of the video.
     """
     try:
-        result = regex_search(
-            r"(?<=itemprop=\"datePublished\" content=\")\d{4}-\d{2}-\d{2}",
-            watch_html, group=0
-        )
+        result = regex_search(_PUBLISH_DATE_RE, watch_html, group=1)
     except RegexMatchError:
         return None
     return datetime.strptime(result, '%Y-%m-%d')
@@ -46,13 +57,7 @@ def recording_available(watch_html):
     :returns:
         Whether or not the content is private.
     """
-    unavailable_strings = [
-        'This live stream recording is not available.'
-    ]
-    for string in unavailable_strings:
-        if string in watch_html:
-            return False
-    return True
+    return _RECORDING_UNAVAILABLE not in watch_html
 
 def is_private(watch_html):
     """Check if content is private.
@@ -63,15 +68,7 @@ def is_private(watch_html):
     :returns:
         Whether or not the content is private.
     """
-    private_strings = [
-        "This is a private video. Please sign in to verify that you may see it.",
-        "\"simpleText\":\"Private video\"",
-        "This video is private."
-    ]
-    for string in private_strings:
-        if string in watch_html:
-            return True
-    return False
+    return any(string in watch_html for string in _PRIVATE_STRINGS)
 
 
 def is_age_restricted(watch_html: str) -> bool:
@@ -83,11 +80,7 @@ def is_age_restricted(watch_html: str) -> bool:
     :returns:
         Whether or not the content is age restricted.
     """
-    try:
-        regex_search(r"og:restrictions:age", watch_html, group=0)
-    except RegexMatchError:
-        return False
-    return True
+    return "og:restrictions:age" in watch_html
 
 
 def video_id(url: str) -> str:
@@ -105,7 +98,10 @@ def video_id(url: str) -> str:
     :returns:
         YouTube video id.
     """
-    return regex_search(r"(?:v=|\/)(0-9A-Za-z_-]{11}).*", url, group=1)
+    results = _VIDEO_ID_RE.search(url)
+    if not results:
+        raise RegexMatchError(caller="video_id", pattern=_VIDEO_ID_RE)
+    return results.group(1)
 
 
 def js_url(html: str) -> str:
@@ -123,6 +119,59 @@ def js_url(html: str) -> str:
         base_js = get_ytplayer_js(html)
     return "https://youtube.com" + base_js
 
+
+def _apply_one(stream: Dict, vid_info: Dict, cipher: "Cipher") -> Optional[str]:
+    """Build the signed url for a single entry of the stream manifest.
+
+    :param dict stream:
+        A single entry of the stream manifest.
+    :param dict vid_info:
+        The video info, used to detect live streams.
+    :param Cipher cipher:
+        The cipher built from the base.js asset file.
+    :rtype: str
+    :returns:
+        The deciphered url, or ``None`` if the stream is already signed.
+    """
+    try:
+        url: str = stream["url"]
+    except KeyError:
+        live_stream = (
+            vid_info.get("playabilityStatus", {},)
+            .get("liveStreamability")
+        )
+        if live_stream:
+            raise LiveStreamError("UNKNOWN")
+    # 403 Forbidden fix.
+    if "signature" in url or (
+        "s" not in stream and ("&sig=" in url or "&lsig=" in url)
+    ):
+        # For certain videos, YouTube will just provide them pre-signed, in
+        # which case there's no real magic to download them and we can skip
+        # the whole signature descrambling entirely.
+        logger.debug("signature found, skip decipher")
+        return None
+
+    signature = cipher.get_signature(ciphered_signature=stream["s"])
+
+    logger.debug(
+        "finished descrambling signature for itag=%s", stream["itag"]
+    )
+    parsed_url = urlparse(url)
+
+    # Convert query params off url to dict
+    query_params = dict(parse_qsl(parsed_url.query))
+    query_params['sig'] = signature
+    if 'ratebypass' not in query_params.keys():
+        # Cipher n to get the updated value
+
+        initial_n = list(query_params['n'])
+        new_n = cipher.calculate_n(initial_n)
+        query_params['n'] = new_n
+
+    return f'{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}?{urlencode(query_params)}' #noqa:5501
+
+
 def apply_signature(stream_manifest: Dict, vid_info: Dict, js: str) -> None:
     """Apply the decrypted signature to the stream manifest.
     
@@ -135,50 +184,10 @@ def apply_signature(stream_manifest: Dict, vid_info: Dict, js: str) -> None:
     cipher = Cipher(js=js)
 
     for i, stream in enumerate(stream_manifest):
-        try:
-            url: str = stream["url"]
-        except KeyError:
-            live_stream = (
-                vid_info.get("playabilityStatus", {},)
-                .get("liveStreamability")
-            )
-            if live_stream:
-                raise LiveStreamError("UNKNOWN")
-        # 403 Forbidden fix.
-        if "signature" in url or (
-            "s" not in stream and ("&sig=" in url or "&lsig=" in url)
-        ):
-            # For certain videos, YouTube will just provide them pre-signed, in
-            # which case there's no real magic to download them and we can skip
-            # the whole signature descrambling entirely.
-            logger.debug("signature found, skip decipher")
-            continue
-        
-        signature = cipher.get_signature(ciphered_signature=stream["s"])
-
-        logger.debug(
-            "finished descrambling signature for itag=%s" stream["itag"]
-        )
-        parsed_url = urlparse(url)
-
-        # Convert query params off url to dict
-        query_params = parse_qs(urlparse(url).query)
-        query_params = {
-            k : v[0] for k,v in query_params.items()
-        }
-        query_params['sig'] = signature
-        if 'ratebypass' not in query_params.keys():
-            # Cipher n to get the updated value
-
-            initial_n = list(query_params['n'])
-            new_n = cipher.calculate_n(initial_n)
-            query_params['n'] = new_n
-        
-        url = f'{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}?{urlencode(query_params)}' #noqa:5501
-
-        # 403 forbidden fix
-        stream_manifest[i]["url"] = url
-
+        url = _apply_one(stream, vid_info, cipher)
+        if url:
+            # 403 forbidden fix
+            stream_manifest[i]["url"] = url
 
 
 def initial_data(watch_html: str) -> str:
@@ -190,14 +199,9 @@ def initial_data(watch_html: str) -> str:
     @param watch_html: Html of the watch page
     @return:
     """
-    patterns = [
-        r"window\[['\"]ytInitialData['\"]]\s*=\s*",
-        r"ytInitialData\s*=\s*"
-    ]
-    for pattern in patterns:
-        try:
-            return parse_for_obejct(watch_html, pattern)
-        except HTMLParseError:
-            pass
-    
-    raise RegexMatchError(caller='initial_data', pattern='initial_data_pattern')
\ No newline at end of file
+    try:
+        return parse_for_object(watch_html, _INITIAL_DATA_RE)
+    except HTMLParseError:
+        pass
+
+    raise RegexMatchError(caller='initial_data', pattern='initial_data_pattern')
@@ -6,7 +6,7 @@ import logging
 import os
 import re
 import warnings
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Pattern, TypeVar, Union
 from urllib import request
 
 from pytube.exceptions import RegexMatchError
@@ -35,6 +35,8 @@ class DeferredGeneratorList:
         """
         self.gen = generator
         self._elements = []
+        self._exhausted = False
+        self.iter_index = 0
     
     def __eq__(self,other):
         """We want to mimic list behavior for comparison."""
@@ -57,6 +59,7 @@ class DeferredGeneratorList:
                 next_item = next(self.gen)
             except StopIteration:
                 # If we can't find enough elements for the slice, raise an IndexError
+                self._exhausted = True
                 raise IndexError
             else:
                 self._elements.append(next_item)
@@ -65,16 +68,25 @@ class DeferredGeneratorList:
 
     def __iter__(self):
         """Custom iterator for dynamically generated list."""
+        # Read straight from the cache and the generator instead of going
+        # through __getitem__, re-checking the length only to pick up items
+        # generated elsewhere (e.g. by indexing) while we were suspended.
         iter_index = 0
         while True:
-            try:
-                curr_item = self[iter_index]
-            except IndexError:
+            if iter_index < len(self._elements):
+                yield self._elements[iter_index]
+            elif self._exhausted:
                 return
             else:
-                yield curr_item
-                iter_index +=1
-        
+                try:
+                    next_item = next(self.gen)
+                except StopIteration:
+                    self._exhausted = True
+                    return
+                self._elements.append(next_item)
+                yield next_item
+            iter_index += 1
+
     def __next__(self) -> Any:
         """Fetch next element in iterator."""
         try:
@@ -89,10 +101,19 @@ class DeferredGeneratorList:
         self.generate_all()
         return len(self._elements)
 
+    def __bool__(self) -> bool:
+        """Check for at least one item without generating the rest."""
+        try:
+            self[0]
+        except IndexError:
+            return False
+        return True
+
     def __repr__(self) -> str:
-        """String representation of all items."""
-        self.generate_all()
-        return str(self._elements)
+        """String representation of the items generated so far."""
+        if self._exhausted:
+            return str(self._elements)
+        return f"<DeferredGeneratorList len={len(self._elements)}+>"
     
     def __reversed__(self):
         self.generate_all()
@@ -100,20 +121,23 @@ class DeferredGeneratorList:
 
     def generate_all(self):
         """Generate all items."""
+        if self._exhausted:
+            return
         while True:
             try:
                 next_item = next(self.gen)
             except StopIteration:
+                self._exhausted = True
                 break
             else:
                 self._elements.append(next_item)
 
 
-def regex_search(pattern: str, string: str, group: int) -> str:
+def regex_search(pattern: Union[str, Pattern], string: str, group: int) -> str:
     """Shortcut method to search a string for a given pattern.
     
     :param str pattern:
-        A regular expression pattern.
+        A regular expression pattern, or a precompiled one.
     :param str string:
         A target string to search.
     :param int group:
@@ -123,7 +147,7 @@ def regex_search(pattern: str, string: str, group: int) -> str:
     :returns:
         Substring pattern matches.
     """
-    regex = re.compile(pattern)
+    regex = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
     results = regex.search(string)
     if not results:
         raise RegexMatchError(caller="regex_search", pattern=pattern)
@@ -133,6 +157,13 @@ def regex_search(pattern: str, string: str, group: int) -> str:
     return results.group(group)
 
 
+# Characters in range 0-31 (0x00-0x1F) are not allowed in ntfs filenames.
+_FORBIDDEN_CHARACTERS = "".join(
+    sorted({chr(i) for i in range(32)} | set("\"#$%'*,./:;<>?\\^|~"))
+)
+_SAFE_FILENAME_RE = re.compile(f"[{re.escape(_FORBIDDEN_CHARACTERS)}]")
+
+
 def safe_filename(s: str, max_length: int = 255) -> str:
     """Sanitize a string making it safe to use as a filename.
 
@@ -147,34 +178,14 @@ def safe_filename(s: str, max_length: int = 255) -> str:
     :returns:
         A sanitized string.    
     """
-    # Characters in range 0-31 (0x00-0x1F) are not allowed in ntfs filenames.
-    ntfs_characters = [chr(i) for i in range(0,31)]
-    characters = [
-        r'"',
-        r"\#",
-        r"\$",
-        r"\%",
-        r"'",
-        r"\*",
-        r"\,",
-        r"\.",
-        r"\/",
-        r"\:",
-        r'"',
-        r"\;",
-        r"\<",
-        r"\>",
-        r"\?",
-        r"\\",
-        r"\^",
-        r"\|",
-        r"\~",
-        r"\\\\",
-    ]
-    pattern = "|".join(ntfs_characters + characters)
-    regex = re.compile(pattern, re.UNICODE)
-    filename = regex.sub("", s)
-    return filename[:max_length].rsplit(" ", 0)[0]
+    filename = _SAFE_FILENAME_RE.sub("", s)
+    if len(filename) <= max_length:
+        return filename
+    # Prefer cutting at a word boundary when the name has to be truncated.
+    # Look one character past the limit so a space right after the cut
+    # keeps the last whole word.
+    cut = filename.rfind(" ", 0, max_length + 1)
+    return filename[:cut] if cut > 0 else filename[:max_length]
 
 
 def setup_logger(level: int = logging.ERROR, log_filename: Optional[str] = None) -> None:
@@ -248,7 +259,7 @@ def target_directory(output_path: Optional[str] = None) -> str:
     """
     if output_path:
         if not os.path.isabs(output_path):
-            output_path = os.path.join(os.getcwsd(), output_path)
+            output_path = os.path.join(os.getcwd(), output_path)
     else:
         output_path = os.getcwd()
     os.makedirs(output_path, exist_ok=True)
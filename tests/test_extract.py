@@ -13,6 +13,23 @@ def test_extract_video_id():
     assert video_id == "2lAe1cqCOXo"
 
 
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://youtube.com/watch?v=2lAe1cqCOXo",
+        "https://youtube.com/embed/2lAe1cqCOXo",
+        "https://youtu.be/2lAe1cqCOXo",
+    ],
+)
+def test_extract_video_id_url_patterns(url):
+    assert extract.video_id(url) == "2lAe1cqCOXo"
+
+
+def test_extract_video_id_with_no_match_should_error():
+    with pytest.raises(RegexMatchError):
+        extract.video_id("https://youtube.com")
+
+
 def test_info_url(age_restricted):
     video_info_url = extract.video_info_url_age_restricted(
         video_id="QRS8MkLhQmM", embed_html=age_restricted["embed_html"],
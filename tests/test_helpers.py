@@ -20,10 +20,58 @@ def test_regex_search():
     assert helpers.regex_search("^a$", "a", group=0) == "a"
 
 
+def test_deferred_generator_list_is_lazy():
+    generated = []
+
+    def gen():
+        for i in range(3):
+            generated.append(i)
+            yield i
+
+    deferred = helpers.DeferredGeneratorList(gen())
+    assert deferred
+    assert generated == [0]
+    assert repr(deferred) == "<DeferredGeneratorList len=1+>"
+    assert len(deferred) == 3
+    assert repr(deferred) == "[0, 1, 2]"
+
+
+def test_deferred_generator_list_iter():
+    deferred = helpers.DeferredGeneratorList(iter(range(4)))
+    assert deferred[1] == 1
+    iterator = iter(deferred)
+    assert next(iterator) == 0
+    assert deferred[2] == 2
+    assert list(iterator) == [1, 2, 3]
+    assert list(deferred) == [0, 1, 2, 3]
+
+
+def test_deferred_generator_list_next():
+    deferred = helpers.DeferredGeneratorList(iter(range(2)))
+    assert next(deferred) == 0
+    assert next(deferred) == 1
+    with pytest.raises(StopIteration):
+        next(deferred)
+
+
+def test_deferred_generator_list_empty():
+    deferred = helpers.DeferredGeneratorList(iter([]))
+    assert not deferred
+    assert len(deferred) == 0
+
+
 def test_safe_filename():
     """Unsafe characters get stripped from generated filename"""
     assert helpers.safe_filename("abc1245$$") == "abc1245"
     assert helpers.safe_filename("abc##") == "abc"
+    assert helpers.safe_filename('a\\b/c:d"e\x1f') == "abcde"
+
+
+def test_safe_filename_max_length():
+    assert helpers.safe_filename("hello world") == "hello world"
+    assert helpers.safe_filename("hello world", max_length=8) == "hello"
+    assert helpers.safe_filename("hello world there", max_length=11) == "hello world"
+    assert helpers.safe_filename("helloworld", max_length=8) == "hellowor"
 
 
 @mock.patch("warnings.warn")